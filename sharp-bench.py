@@ -0,0 +1,271 @@
+import argparse
+import hashlib
+import json
+import os
+import statistics
+import sys
+import time
+import sharp_engine as engine
+
+# ==============================================================================
+# 📏 SHARP BENCH — cross-profile scoring regression + latency harness
+# ==============================================================================
+# Replays a corpus of JD/CV/transcript triples through each engine profile and
+# reports score drift, token counts and latency per profile.
+#
+# CORPUS FORMAT (JSONL, one case per line):
+#   {"id": "case-01", "jd": "...", "cv": "...", "transcript": "...",
+#    "responses": {"v2.3.1": {"text": "<raw model output>", "input_tokens": 812,
+#                             "output_tokens": 604, "latency_s": 14.2}, ...}}
+#   `responses` is only needed for --mode replay (and is written by --record).
+#   A response marked `"synthetic": true` is a hand-written fixture, not recorded
+#   model output; its tokens/latency are flagged with `*` in the report.
+#   bench/sample_corpus.jsonl is all synthetic so replay runs out of the box.
+#
+# MODES:
+#   replay  Serve recorded responses (no network). Default.
+#   fake    Deterministic synthetic responses built from each profile's score_map.
+#   live    Real Anthropic calls. Add --record to write responses back to the corpus.
+#
+# USAGE:
+#   python sharp-bench.py bench/sample_corpus.jsonl
+#   python sharp-bench.py bench/sample_corpus.jsonl --mode fake --profiles v2.3.1 v1.9
+#   python sharp-bench.py corpus.jsonl --mode live --record --json report.json
+#
+# Exits non-zero if any case/profile run errored.
+
+CHARS_PER_TOKEN = 4 # Rough estimate used when a response carries no usage data
+
+# --- FAKE CLIENTS ---
+# Shaped like the bits of the Anthropic SDK that sharp_engine touches:
+# client.messages.create(...) -> message.content[0].text / message.usage.*
+
+class _Obj:
+    def __init__(self, **kw): self.__dict__.update(kw)
+
+def _message(text, input_tokens=None, output_tokens=None):
+    usage = None
+    if input_tokens is not None or output_tokens is not None:
+        usage = _Obj(input_tokens=input_tokens, output_tokens=output_tokens)
+    return _Obj(content=[_Obj(text=text)], usage=usage)
+
+def estimate_tokens(text):
+    return max(1, len(text) // CHARS_PER_TOKEN)
+
+class ReplayClient:
+    """Serves the recorded response for (case, profile), replaying its latency if asked."""
+    def __init__(self, case, profile_name, sleep=False):
+        self.case, self.profile_name, self.sleep = case, profile_name, sleep
+        self.messages = self
+
+    def create(self, **kwargs):
+        rec = self.case.get("responses", {}).get(self.profile_name)
+        if rec is None:
+            raise LookupError(f"No recorded response for case '{self.case['id']}' / profile '{self.profile_name}'")
+        if self.sleep and rec.get("latency_s"): time.sleep(rec["latency_s"])
+        return _message(rec["text"], rec.get("input_tokens"), rec.get("output_tokens"))
+
+class FakeClient:
+    """Builds a schema-shaped response whose scores are a stable hash of the inputs.
+
+    Reports no usage, so token counts fall back to (and are flagged as) estimates.
+    """
+    def __init__(self, case, profile_name):
+        self.case, self.profile_name = case, profile_name
+        self.messages = self
+
+    def create(self, system, messages, **kwargs):
+        profile = engine.get_profile(self.profile_name)
+        result = {}
+        for metric, path in profile["score_map"].items():
+            digest = hashlib.sha256(f"{self.profile_name}:{self.case['id']}:{metric}".encode()).digest()
+            _set(result, path, digest[0] % 11)
+        role_fit = engine.lookup(result, profile["score_map"]["role_fit"])
+        _set(result, profile["verdict_key"], "Hire" if role_fit >= 6 else "No Hire")
+        _set(result, "candidate.name", self.case["id"])
+        return _message(json.dumps(result))
+
+def _set(data, dotted_key, value):
+    parts = dotted_key.split('.')
+    for part in parts[:-1]: data = data.setdefault(part, {})
+    data[parts[-1]] = value
+
+def make_client(mode, case, profile_name, live_client=None, sleep=False):
+    if mode == "replay": return ReplayClient(case, profile_name, sleep)
+    if mode == "fake": return FakeClient(case, profile_name)
+    return live_client
+
+def make_live_client():
+    try:
+        from anthropic import Anthropic
+    except ImportError:
+        sys.exit("❌ --mode live needs the 'anthropic' package.")
+    api_key = os.environ.get("ANTHROPIC_API_KEY")
+    if not api_key: sys.exit("❌ --mode live needs ANTHROPIC_API_KEY.")
+    return Anthropic(api_key=api_key)
+
+# --- CORPUS ---
+
+def load_corpus(path):
+    cases = []
+    with open(path, encoding="utf-8") as f:
+        for n, line in enumerate(f, 1):
+            if not line.strip(): continue
+            case = json.loads(line)
+            for field in ("jd", "cv", "transcript"):
+                if field not in case: raise ValueError(f"{path}:{n} missing '{field}'")
+            case.setdefault("id", f"case-{n:02d}")
+            cases.append(case)
+    return cases
+
+def save_corpus(path, cases):
+    with open(path, "w", encoding="utf-8") as f:
+        for case in cases: f.write(json.dumps(case, ensure_ascii=False) + "\n")
+
+# --- RUNNER ---
+
+def run_bench(cases, profiles, mode="replay", live_client=None, record=False, sleep=False):
+    """Returns {profile: [run, ...]} with one engine run per case, in corpus order."""
+    runs = {p: [] for p in profiles}
+    for case in cases:
+        for profile_name in profiles:
+            client = make_client(mode, case, profile_name, live_client, sleep)
+            run = engine.run_analysis(client, profile_name, case["transcript"], case["cv"], case["jd"])
+            if run["input_tokens"] is None:
+                user_msg = engine.build_user_message(engine.get_profile(profile_name), case["transcript"], case["cv"], case["jd"])
+                run["input_tokens"] = estimate_tokens(engine.get_profile(profile_name)["system_prompt"] + user_msg)
+                run["tokens_estimated"] = True
+            if run["output_tokens"] is None and run["raw_text"]:
+                run["output_tokens"] = estimate_tokens(run["raw_text"])
+                run["tokens_estimated"] = True
+            if mode != "live":
+                # Measured latency is just local parse time; report what was recorded (if any).
+                recorded = case.get("responses", {}).get(profile_name, {})
+                run["latency_s"] = recorded.get("latency_s") if mode == "replay" else None
+                run["synthetic"] = mode == "replay" and bool(recorded.get("synthetic"))
+            if record and mode == "live" and run["raw_text"] is not None:
+                case.setdefault("responses", {})[profile_name] = {
+                    "text": run["raw_text"],
+                    "input_tokens": run["input_tokens"],
+                    "output_tokens": run["output_tokens"],
+                    "latency_s": round(run["latency_s"], 3),
+                }
+            run["case_id"] = case["id"]
+            run["scores"] = canonical_or_empty(profile_name, run["result"])
+            run["verdict"] = None if "error" in run["result"] else engine.canonical_verdict(profile_name, run["result"])
+            runs[profile_name].append(run)
+    return runs
+
+def canonical_or_empty(profile_name, result):
+    if "error" in result: return {}
+    return engine.canonical_scores(profile_name, result)
+
+# --- REPORT ---
+
+def _mean(values):
+    values = [v for v in values if v is not None]
+    return statistics.mean(values) if values else None
+
+def _pct(values, q):
+    values = sorted(v for v in values if v is not None)
+    if not values: return None
+    return values[min(len(values) - 1, int(round(q * (len(values) - 1))))]
+
+def summarize(runs, baseline):
+    """Per-profile token/latency stats plus score drift against the baseline profile."""
+    report = {"baseline": baseline, "profiles": {}, "errors": []}
+    base_runs = runs[baseline]
+    for profile_name, profile_runs in runs.items():
+        ok = [r for r in profile_runs if "error" not in r["result"]]
+        report["errors"] += [{"case_id": r["case_id"], "profile": profile_name, "error": r["result"]["error"]}
+                             for r in profile_runs if "error" in r["result"]]
+        latencies = [r["latency_s"] for r in ok]
+        drift, verdict_matches, verdict_total = {}, 0, 0
+        for run, base in zip(profile_runs, base_runs):
+            for metric, score in run["scores"].items():
+                ref = base["scores"].get(metric)
+                if isinstance(score, (int, float)) and isinstance(ref, (int, float)):
+                    drift.setdefault(metric, []).append(score - ref)
+            if run["verdict"] and base["verdict"]:
+                verdict_total += 1
+                verdict_matches += run["verdict"] == base["verdict"]
+        report["profiles"][profile_name] = {
+            "cases": len(profile_runs),
+            "errors": len(profile_runs) - len(ok),
+            "input_tokens_mean": _mean(r["input_tokens"] for r in ok),
+            "output_tokens_mean": _mean(r["output_tokens"] for r in ok),
+            "tokens_estimated": any(r.get("tokens_estimated") for r in ok),
+            "synthetic": any(r.get("synthetic") for r in ok),
+            "latency_p50_s": _pct(latencies, 0.5),
+            "latency_p95_s": _pct(latencies, 0.95),
+            "drift_mean": {m: _mean(d) for m, d in drift.items()},
+            "drift_mean_abs": {m: _mean(abs(x) for x in d) for m, d in drift.items()},
+            "verdict_agreement": (verdict_matches / verdict_total) if verdict_total else None,
+        }
+    return report
+
+def _fmt(value, spec):
+    return "-" if value is None else format(value, spec)
+
+def print_report(report):
+    baseline = report["baseline"]
+    print(f"\n📏 SHARP BENCH — baseline profile: {baseline}\n")
+    print(f"{'PROFILE':<10} {'CASES':>5} {'ERR':>4} {'IN TOK':>8} {'OUT TOK':>8} {'P50 s':>7} {'P95 s':>7} {'VERDICT=':>9}")
+    for name, p in report["profiles"].items():
+        syn = "*" if p["synthetic"] else " "
+        est = "~" if p["tokens_estimated"] else syn
+        print(f"{name:<10} {p['cases']:>5} {p['errors']:>4} "
+              f"{est}{_fmt(p['input_tokens_mean'], '.0f'):>7} {est}{_fmt(p['output_tokens_mean'], '.0f'):>7} "
+              f"{syn}{_fmt(p['latency_p50_s'], '.2f'):>6} {syn}{_fmt(p['latency_p95_s'], '.2f'):>6} "
+              f"{_fmt(p['verdict_agreement'], '.0%'):>9}")
+    print(f"\nSCORE DRIFT vs {baseline} (mean / mean abs, 0-10 scale)")
+    for name, p in report["profiles"].items():
+        if name == baseline: continue
+        cells = [f"{m}: {_fmt(p['drift_mean'][m], '+.2f')} / {_fmt(p['drift_mean_abs'][m], '.2f')}" for m in p["drift_mean"]]
+        print(f"  {name:<10} " + (" | ".join(cells) if cells else "no comparable scores"))
+    profiles = report["profiles"].values()
+    if any(p["tokens_estimated"] for p in profiles) or any(p["synthetic"] for p in profiles): print()
+    if any(p["tokens_estimated"] for p in profiles):
+        print("~ = token count estimated from characters (no usage data in response)")
+    if any(p["synthetic"] for p in profiles):
+        print("* = synthetic fixture values (hand-written, not recorded model output)")
+    if report["errors"]:
+        print(f"\n❌ {len(report['errors'])} FAILED RUN(S)")
+        for e in report["errors"]: print(f"  {e['case_id']} / {e['profile']}: {e['error']}")
+
+# --- CLI ---
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a JD/CV/transcript corpus through sharp_engine profiles.")
+    parser.add_argument("corpus", help="JSONL corpus file")
+    parser.add_argument("--profiles", nargs="+", default=list(engine.PROFILES), help="Profiles to run (default: all)")
+    parser.add_argument("--baseline", help="Profile to measure drift against (default: first profile)")
+    parser.add_argument("--mode", choices=["replay", "fake", "live"], default="replay")
+    parser.add_argument("--record", action="store_true", help="With --mode live, write responses back into the corpus")
+    parser.add_argument("--sleep", action="store_true", help="With --mode replay, sleep for the recorded latency")
+    parser.add_argument("--json", dest="json_out", help="Also write the full report to this path")
+    args = parser.parse_args(argv)
+
+    if args.record and args.mode != "live": parser.error("--record needs --mode live")
+    if args.sleep and args.mode != "replay": parser.error("--sleep needs --mode replay")
+    args.profiles = list(dict.fromkeys(args.profiles)) # De-dupe, keep order
+    for name in args.profiles:
+        if name not in engine.PROFILES: parser.error(f"unknown profile '{name}' (available: {', '.join(engine.PROFILES)})")
+    baseline = args.baseline or args.profiles[0]
+    if baseline not in args.profiles: parser.error(f"--baseline '{baseline}' is not in --profiles")
+
+    cases = load_corpus(args.corpus)
+    live_client = make_live_client() if args.mode == "live" else None
+    runs = run_bench(cases, args.profiles, args.mode, live_client, args.record, args.sleep)
+    report = summarize(runs, baseline)
+    print_report(report)
+
+    if args.record and args.mode == "live": save_corpus(args.corpus, cases)
+    if args.json_out:
+        report["runs"] = {p: [{k: r[k] for k in ("case_id", "scores", "verdict", "input_tokens", "output_tokens", "latency_s")}
+                              | {"error": r["result"].get("error")} for r in rs] for p, rs in runs.items()}
+        with open(args.json_out, "w", encoding="utf-8") as f: json.dump(report, f, indent=2)
+    return report
+
+if __name__ == "__main__":
+    sys.exit(1 if main()["errors"] else 0)
@@ -1,13 +1,12 @@
 import streamlit as st
 import pandas as pd
-import json
 import os
 from anthropic import Anthropic
 from openai import OpenAI
-from pypdf import PdfReader
-from docx import Document
+import sharp_engine as engine
 
 # --- CONFIGURATION ---
+APP_PROFILE = "v1.9" # Prompt/schema profile in sharp_engine.PROFILES
 st.set_page_config(page_title="Sharp Hire v1.9", page_icon="🎯", layout="wide")
 
 # --- SHARP PALETTE CSS ---
@@ -93,96 +92,10 @@ def track_cost(provider, amount):
     st.session_state.total_cost += amount
 
 def extract_text_from_file(file):
-    try:
-        file_type = file.name.split('.')[-1].lower()
-        if file_type in ['mp3', 'm4a', 'wav', 'mp4', 'mpeg', 'mpga']:
-            return transcribe_audio(file)
-        elif file_type == 'pdf':
-            reader = PdfReader(file)
-            return "\n".join([page.extract_text() for page in reader.pages])
-        elif file_type == 'docx':
-            doc = Document(file)
-            return "\n".join([para.text for para in doc.paragraphs])
-        elif file_type in ['txt', 'md']:
-            return file.read().decode("utf-8")
-        return "Unsupported format."
-    except Exception as e:
-        return f"Error extracting {file.name}: {str(e)}"
-
-def transcribe_audio(file):
-    try:
-        transcript = openai_client.audio.transcriptions.create(model="whisper-1", file=file)
-        track_cost("OpenAI (Audio)", 0.06) # Est cost per file
-        return transcript.text
-    except Exception as e:
-        return f"Whisper Error: {str(e)}"
-
-def clean_json_response(txt):
-    txt = txt.strip()
-    if "```json" in txt: txt = txt.split("```json")[1].split("```")[0]
-    elif "```" in txt: txt = txt.split("```")[1].split("```")[0]
-    return txt.strip()
+    return engine.extract_text_from_file(file, openai_client, track_cost)
 
 def analyze_forensic(transcript, cv_text, jd_text):
-    system_prompt = f"""
-    You are a FORENSIC Talent Auditor. Your job is to strictly evaluate a hiring interaction.
-    
-    **DATA POINTS:**
-    1. **JD (The Standard):** What is required.
-    2. **CV (The Claim):** What the candidate says they did.
-    3. **TRANSCRIPT (The Evidence):** What actually happened.
-
-    **SCORING PROTOCOL (0-10):**
-    - **5/10 is AVERAGE.** Do not give 7s or 8s for "okay" answers.
-    - **Discrepancy Penalty:** If Transcript contradicts CV, deduct 3 points immediately.
-
-    **OUTPUT JSON:**
-    {{
-        "candidate": {{
-            "name": "Name",
-            "scores": {{
-                "technical_depth": 0,
-                "communication_clarity": 0,
-                "cultural_alignment": 0,
-                "role_match_index": 0
-            }},
-            "score_reasoning": {{
-                "tech_reason": "Why this score? Cite specific evidence.",
-                "comm_reason": "Why this score?",
-                "match_reason": "Why this score?"
-            }},
-            "flags": {{
-                "cv_discrepancies": ["List specific contradictions"],
-                "red_flags": ["Behavioral or technical concerns"]
-            }},
-            "summary_verdict": "Hire / No Hire / Strong Hire"
-        }},
-        "recruiter": {{
-            "scores": {{
-                "question_difficulty": 0,
-                "listening_skills": 0,
-                "jd_coverage": 0
-            }},
-            "missed_opportunities": ["Critical JD topics the recruiter forgot to ask"],
-            "coaching_tip": "One high-impact tip to improve."
-        }}
-    }}
-    """
-
-    user_msg = f"JD: {jd_text[:10000]}\nCV: {cv_text[:10000]}\nTRANSCRIPT: {transcript[:50000]}"
-
-    try:
-        message = anthropic_client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=4000,
-            temperature=0.1, 
-            system=system_prompt,
-            messages=[{"role": "user", "content": user_msg}]
-        )
-        track_cost("Anthropic (Intel)", 0.03) # Est cost per analysis
-        return json.loads(clean_json_response(message.content[0].text))
-    except Exception as e:
-        return {"error": str(e)}
+    return engine.analyze(anthropic_client, APP_PROFILE, transcript, cv_text, jd_text, track_cost)
 
 def render_neon_progress(label, score, max_score=10):
     pct = (score / max_score) * 100
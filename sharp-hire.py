@@ -1,6 +1,5 @@
 import streamlit as st
 import pandas as pd
-import json
 import os
 import smtplib
 from email.mime.text import MIMEText
@@ -8,15 +7,15 @@ from email.mime.multipart import MIMEMultipart
 from email.mime.application import MIMEApplication
 from anthropic import Anthropic
 from openai import OpenAI
-from pypdf import PdfReader
-from docx import Document
 from fpdf import FPDF
+import sharp_engine as engine
 
 # ==============================================================================
 # 🧠 SHARP-STANDARDS PROTOCOL (v2.3.1)
 # ==============================================================================
 
 APP_VERSION = "v2.3.1"
+APP_PROFILE = "v2.3.1" # Prompt/schema profile in sharp_engine.PROFILES
 st.set_page_config(page_title="Sharp Hire", page_icon="🎯", layout="wide")
 
 # --- CSS: SHARP PALETTE ---
@@ -100,35 +99,7 @@ def track_cost(provider, amount):
     st.session_state.total_cost += amount
 
 def extract_text_from_file(file):
-    try:
-        file_type = file.name.split('.')[-1].lower()
-        if file_type in ['mp3', 'm4a', 'wav', 'mp4', 'mpeg', 'mpga']:
-            return transcribe_audio(file)
-        elif file_type == 'pdf':
-            reader = PdfReader(file)
-            return "\n".join([page.extract_text() for page in reader.pages])
-        elif file_type == 'docx':
-            doc = Document(file)
-            return "\n".join([para.text for para in doc.paragraphs])
-        elif file_type in ['txt', 'md']:
-            return file.read().decode("utf-8")
-        return "Unsupported format."
-    except Exception as e:
-        return f"Error extracting {file.name}: {str(e)}"
-
-def transcribe_audio(file):
-    try:
-        transcript = openai_client.audio.transcriptions.create(model="whisper-1", file=file)
-        track_cost("OpenAI (Audio)", 0.06) 
-        return transcript.text
-    except Exception as e:
-        return f"Whisper Error: {str(e)}"
-
-def clean_json_response(txt):
-    txt = txt.strip()
-    if "```json" in txt: txt = txt.split("```json")[1].split("```")[0]
-    elif "```" in txt: txt = txt.split("```")[1].split("```")[0]
-    return txt.strip()
+    return engine.extract_text_from_file(file, openai_client, track_cost)
 
 # --- PDF GENERATOR ---
 class SharpPDF(FPDF):
@@ -205,55 +176,7 @@ def send_email(to_email, pdf_bytes):
 
 # --- ANALYSIS ENGINE ---
 def analyze_comprehensive(transcript, cv_text, jd_text):
-    # FIX: Explicitly demanding 'cv_truthfulness' in the prompt
-    system_prompt = f"""
-    You are a FORENSIC Talent Auditor. Perform a deep, multi-vector analysis.
-    
-    **DATA:** JD (Required), CV (Claims), TRANSCRIPT (Evidence).
-
-    **ANALYSIS VECTORS:**
-    1. **Recruiter:** Did they dig deep?
-    2. **Cand vs JD:** Skills match?
-    3. **Cand vs Questions:** Answer Quality/Directness.
-    4. **Cand vs CV:** Truthfulness (Did they lie?).
-
-    **OUTPUT JSON STRUCTURE:**
-    {{
-        "executive_summary": "High-level narrative.",
-        "candidate": {{
-            "name": "Inferred Name",
-            "scores": {{ 
-                "cv_match_score": 0, 
-                "interview_performance_score": 0, 
-                "technical_depth": 0, 
-                "culture_fit": 0,
-                "cv_truthfulness": 0 
-            }},
-            "fit_analysis": {{ "gap_analysis": "...", "jd_vs_transcript": "..." }},
-            "strengths": ["..."],
-            "red_flags": ["..."],
-            "verdict": "Hire / No Hire"
-        }},
-        "recruiter": {{
-            "scores": {{ "question_quality": 0, "jd_coverage": 0 }},
-            "missed_opportunities": ["..."],
-            "coaching_tip": "..."
-        }}
-    }}
-    """
-    user_msg = f"JD: {jd_text[:10000]}\nCV: {cv_text[:10000]}\nTRANSCRIPT: {transcript[:40000]}"
-    try:
-        message = anthropic_client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=4000,
-            temperature=0.1, 
-            system=system_prompt,
-            messages=[{"role": "user", "content": user_msg}]
-        )
-        track_cost("Anthropic (Intel)", 0.03) 
-        return json.loads(clean_json_response(message.content[0].text))
-    except Exception as e:
-        return {"error": str(e)}
+    return engine.analyze(anthropic_client, APP_PROFILE, transcript, cv_text, jd_text, track_cost)
 
 def render_neon_progress(label, score, max_score=10):
     # Handle missing keys gracefully just in case
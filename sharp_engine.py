@@ -0,0 +1,256 @@
+import json
+import time
+
+# ==============================================================================
+# 🧠 SHARP ENGINE — shared extraction + analysis core
+# ==============================================================================
+# Both front-ends (sharp-hire.py, sharp-hire-sim.py) and the bench harness
+# (sharp-bench.py) go through this module. Nothing in here touches Streamlit:
+# clients are passed in, and spend is reported through an `on_cost(provider, amount)`
+# callback so each app can keep its own session-state ledger.
+
+MODEL = "claude-sonnet-4-20250514"
+MAX_TOKENS = 4000
+TEMPERATURE = 0.1
+
+AUDIO_TYPES = ['mp3', 'm4a', 'wav', 'mp4', 'mpeg', 'mpga']
+AUDIO_COST = 0.06    # Est cost per file
+ANALYSIS_COST = 0.03 # Est cost per analysis
+
+# --- PROMPTS ---
+# Copied verbatim (trailing whitespace included) from the original per-app
+# f-strings, so each profile sends exactly what its front-end used to send.
+
+PROMPT_V2_3_1 = """
+    You are a FORENSIC Talent Auditor. Perform a deep, multi-vector analysis.
+    
+    **DATA:** JD (Required), CV (Claims), TRANSCRIPT (Evidence).
+
+    **ANALYSIS VECTORS:**
+    1. **Recruiter:** Did they dig deep?
+    2. **Cand vs JD:** Skills match?
+    3. **Cand vs Questions:** Answer Quality/Directness.
+    4. **Cand vs CV:** Truthfulness (Did they lie?).
+
+    **OUTPUT JSON STRUCTURE:**
+    {
+        "executive_summary": "High-level narrative.",
+        "candidate": {
+            "name": "Inferred Name",
+            "scores": { 
+                "cv_match_score": 0, 
+                "interview_performance_score": 0, 
+                "technical_depth": 0, 
+                "culture_fit": 0,
+                "cv_truthfulness": 0 
+            },
+            "fit_analysis": { "gap_analysis": "...", "jd_vs_transcript": "..." },
+            "strengths": ["..."],
+            "red_flags": ["..."],
+            "verdict": "Hire / No Hire"
+        },
+        "recruiter": {
+            "scores": { "question_quality": 0, "jd_coverage": 0 },
+            "missed_opportunities": ["..."],
+            "coaching_tip": "..."
+        }
+    }
+    """
+
+PROMPT_V1_9 = """
+    You are a FORENSIC Talent Auditor. Your job is to strictly evaluate a hiring interaction.
+    
+    **DATA POINTS:**
+    1. **JD (The Standard):** What is required.
+    2. **CV (The Claim):** What the candidate says they did.
+    3. **TRANSCRIPT (The Evidence):** What actually happened.
+
+    **SCORING PROTOCOL (0-10):**
+    - **5/10 is AVERAGE.** Do not give 7s or 8s for "okay" answers.
+    - **Discrepancy Penalty:** If Transcript contradicts CV, deduct 3 points immediately.
+
+    **OUTPUT JSON:**
+    {
+        "candidate": {
+            "name": "Name",
+            "scores": {
+                "technical_depth": 0,
+                "communication_clarity": 0,
+                "cultural_alignment": 0,
+                "role_match_index": 0
+            },
+            "score_reasoning": {
+                "tech_reason": "Why this score? Cite specific evidence.",
+                "comm_reason": "Why this score?",
+                "match_reason": "Why this score?"
+            },
+            "flags": {
+                "cv_discrepancies": ["List specific contradictions"],
+                "red_flags": ["Behavioral or technical concerns"]
+            },
+            "summary_verdict": "Hire / No Hire / Strong Hire"
+        },
+        "recruiter": {
+            "scores": {
+                "question_difficulty": 0,
+                "listening_skills": 0,
+                "jd_coverage": 0
+            },
+            "missed_opportunities": ["Critical JD topics the recruiter forgot to ask"],
+            "coaching_tip": "One high-impact tip to improve."
+        }
+    }
+    """
+
+# --- PROFILES ---
+# A profile pins a prompt/schema version plus its truncation limits.
+# `score_map` maps the canonical metrics used by the bench harness onto each
+# schema's own keys (dotted paths), so drift can be compared across versions.
+# `verdict_key` is where that schema keeps its hire/no-hire call.
+#
+# Pairing notes (these choices set the reported drift):
+#   role_fit — v1.9 `role_match_index` ("Role Match Index", `match_reason`) is the
+#              candidate-vs-JD match, so it pairs with v2.3.1 `cv_match_score`
+#              ("Paper Fit"), not `interview_performance_score` ("Actual Fit").
+#   culture  — `culture_fit` and `cultural_alignment` are the same axis, renamed.
+#   v2.3.1 `interview_performance_score` / `cv_truthfulness` and v1.9
+#   `communication_clarity` have no counterpart and are left out.
+
+PROFILES = {
+    "v2.3.1": {
+        "system_prompt": PROMPT_V2_3_1,
+        "jd_limit": 10000,
+        "cv_limit": 10000,
+        "transcript_limit": 40000,
+        "score_map": {
+            "technical_depth": "candidate.scores.technical_depth",
+            "role_fit": "candidate.scores.cv_match_score",
+            "culture": "candidate.scores.culture_fit",
+            "jd_coverage": "recruiter.scores.jd_coverage",
+        },
+        "verdict_key": "candidate.verdict",
+    },
+    "v1.9": {
+        "system_prompt": PROMPT_V1_9,
+        "jd_limit": 10000,
+        "cv_limit": 10000,
+        "transcript_limit": 50000,
+        "score_map": {
+            "technical_depth": "candidate.scores.technical_depth",
+            "role_fit": "candidate.scores.role_match_index",
+            "culture": "candidate.scores.cultural_alignment",
+            "jd_coverage": "recruiter.scores.jd_coverage",
+        },
+        "verdict_key": "candidate.summary_verdict",
+    },
+}
+
+DEFAULT_PROFILE = "v2.3.1"
+
+def get_profile(name):
+    if name not in PROFILES:
+        raise KeyError(f"Unknown profile '{name}'. Available: {', '.join(PROFILES)}")
+    return PROFILES[name]
+
+# --- EXTRACTION ---
+
+def extract_text_from_file(file, openai_client=None, on_cost=None):
+    try:
+        file_type = file.name.split('.')[-1].lower()
+        if file_type in AUDIO_TYPES:
+            return transcribe_audio(file, openai_client, on_cost)
+        elif file_type == 'pdf':
+            # Parsers are imported per branch so the bench can replay JSON without them.
+            from pypdf import PdfReader
+            reader = PdfReader(file)
+            return "\n".join([page.extract_text() for page in reader.pages])
+        elif file_type == 'docx':
+            from docx import Document
+            doc = Document(file)
+            return "\n".join([para.text for para in doc.paragraphs])
+        elif file_type in ['txt', 'md']:
+            return file.read().decode("utf-8")
+        return "Unsupported format."
+    except Exception as e:
+        return f"Error extracting {file.name}: {str(e)}"
+
+def transcribe_audio(file, openai_client, on_cost=None):
+    try:
+        transcript = openai_client.audio.transcriptions.create(model="whisper-1", file=file)
+        if on_cost: on_cost("OpenAI (Audio)", AUDIO_COST)
+        return transcript.text
+    except Exception as e:
+        return f"Whisper Error: {str(e)}"
+
+def clean_json_response(txt):
+    txt = txt.strip()
+    if "```json" in txt: txt = txt.split("```json")[1].split("```")[0]
+    elif "```" in txt: txt = txt.split("```")[1].split("```")[0]
+    return txt.strip()
+
+# --- ANALYSIS ---
+
+def build_user_message(profile, transcript, cv_text, jd_text):
+    return (f"JD: {jd_text[:profile['jd_limit']]}\n"
+            f"CV: {cv_text[:profile['cv_limit']]}\n"
+            f"TRANSCRIPT: {transcript[:profile['transcript_limit']]}")
+
+def run_analysis(anthropic_client, profile_name, transcript, cv_text, jd_text, on_cost=None):
+    """Runs one analysis call and returns the parsed result plus call telemetry.
+
+    Returns a dict with `result` (parsed JSON, or {"error": ...}), `raw_text`,
+    `input_tokens`, `output_tokens` and `latency_s`. Token counts are None when
+    the client does not report usage.
+    """
+    profile = get_profile(profile_name)
+    user_msg = build_user_message(profile, transcript, cv_text, jd_text)
+    run = {"profile": profile_name, "result": None, "raw_text": None,
+           "input_tokens": None, "output_tokens": None, "latency_s": None}
+    started = time.perf_counter()
+    try:
+        message = anthropic_client.messages.create(
+            model=MODEL,
+            max_tokens=MAX_TOKENS,
+            temperature=TEMPERATURE,
+            system=profile["system_prompt"],
+            messages=[{"role": "user", "content": user_msg}]
+        )
+        run["latency_s"] = time.perf_counter() - started
+        usage = getattr(message, "usage", None)
+        if usage is not None:
+            run["input_tokens"] = getattr(usage, "input_tokens", None)
+            run["output_tokens"] = getattr(usage, "output_tokens", None)
+        if on_cost: on_cost("Anthropic (Intel)", ANALYSIS_COST)
+        run["raw_text"] = message.content[0].text
+        parsed = json.loads(clean_json_response(run["raw_text"]))
+        # Callers (and both dashboards) index into the result, so only accept objects.
+        run["result"] = parsed if isinstance(parsed, dict) else {"error": "non-object JSON"}
+    except Exception as e:
+        if run["latency_s"] is None: run["latency_s"] = time.perf_counter() - started
+        run["result"] = {"error": str(e)}
+    return run
+
+def analyze(anthropic_client, profile_name, transcript, cv_text, jd_text, on_cost=None):
+    return run_analysis(anthropic_client, profile_name, transcript, cv_text, jd_text, on_cost)["result"]
+
+# --- SCORE HELPERS ---
+
+def lookup(data, dotted_key):
+    for part in dotted_key.split('.'):
+        if not isinstance(data, dict) or part not in data: return None
+        data = data[part]
+    return data
+
+def canonical_scores(profile_name, result):
+    """Projects a profile-specific result onto the shared metric names."""
+    profile = get_profile(profile_name)
+    return {metric: lookup(result, path) for metric, path in profile["score_map"].items()}
+
+def canonical_verdict(profile_name, result):
+    """Collapses 'Hire' / 'Strong Hire' / 'No Hire' into hire / no_hire."""
+    verdict = lookup(result, get_profile(profile_name)["verdict_key"])
+    if not isinstance(verdict, str): return None
+    v = verdict.lower()
+    if "no hire" in v or "no-hire" in v: return "no_hire"
+    if "hire" in v: return "hire"
+    return None
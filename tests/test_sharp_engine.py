@@ -0,0 +1,116 @@
+import importlib.util
+import json
+import os
+import sys
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+import sharp_engine as engine
+
+SAMPLE_CORPUS = os.path.join(ROOT, "bench", "sample_corpus.jsonl")
+
+def _load_bench():
+    spec = importlib.util.spec_from_file_location("sharp_bench", os.path.join(ROOT, "sharp-bench.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+bench = _load_bench()
+
+class _Client:
+    """Minimal stand-in for the Anthropic client: returns `text` or raises `exc`."""
+    def __init__(self, text=None, exc=None):
+        self.text, self.exc = text, exc
+        self.messages = self
+
+    def create(self, **kwargs):
+        if self.exc: raise self.exc
+        return bench._message(self.text, 10, 20)
+
+# --- PROFILES ---
+
+def test_get_profile_unknown_raises():
+    with pytest.raises(KeyError):
+        engine.get_profile("v0.0")
+
+def test_build_user_message_truncates_per_profile():
+    transcript = "x" * 60000
+    for name, limit in [("v2.3.1", 40000), ("v1.9", 50000)]:
+        msg = engine.build_user_message(engine.get_profile(name), transcript, "cv", "jd")
+        assert msg.endswith("TRANSCRIPT: " + "x" * limit)
+
+def test_prompts_have_no_fstring_escapes():
+    for profile in engine.PROFILES.values():
+        assert "{{" not in profile["system_prompt"]
+
+# --- ANALYSIS ---
+
+def test_run_analysis_parses_fenced_json():
+    run = engine.run_analysis(_Client('```json\n{"candidate": {"verdict": "Hire"}}\n```'), "v2.3.1", "t", "c", "j")
+    assert run["result"] == {"candidate": {"verdict": "Hire"}}
+    assert (run["input_tokens"], run["output_tokens"]) == (10, 20)
+
+def test_run_analysis_error_paths():
+    costs = []
+    run = engine.run_analysis(_Client(exc=RuntimeError("boom")), "v1.9", "t", "c", "j", lambda *a: costs.append(a))
+    assert run["result"] == {"error": "boom"}
+    assert run["latency_s"] is not None and costs == []
+    for text in ("5", "[1, 2]"):
+        assert engine.run_analysis(_Client(text), "v1.9", "t", "c", "j")["result"] == {"error": "non-object JSON"}
+    assert "error" in engine.run_analysis(_Client("not json"), "v1.9", "t", "c", "j")["result"]
+
+def test_canonical_scores_and_verdict():
+    v231 = {"candidate": {"scores": {"technical_depth": 8, "cv_match_score": 7, "culture_fit": 6}, "verdict": "No Hire"},
+            "recruiter": {"scores": {"jd_coverage": 5}}}
+    v19 = {"candidate": {"scores": {"technical_depth": 6, "role_match_index": 7}, "summary_verdict": "Strong Hire"}}
+    assert engine.canonical_scores("v2.3.1", v231) == {"technical_depth": 8, "role_fit": 7, "culture": 6, "jd_coverage": 5}
+    assert engine.canonical_scores("v1.9", v19) == {"technical_depth": 6, "role_fit": 7, "culture": None, "jd_coverage": None}
+    assert engine.canonical_verdict("v2.3.1", v231) == "no_hire"
+    assert engine.canonical_verdict("v1.9", v19) == "hire"
+    assert engine.canonical_verdict("v1.9", {}) is None
+
+# --- BENCH ---
+
+@pytest.mark.parametrize("mode", ["replay", "fake"])
+def test_sample_corpus_runs_clean(mode, tmp_path):
+    out = tmp_path / "report.json"
+    report = bench.main([SAMPLE_CORPUS, "--mode", mode, "--json", str(out)])
+    assert report["errors"] == []
+    for name, p in report["profiles"].items():
+        assert p["errors"] == 0
+        assert p["input_tokens_mean"] is not None and p["output_tokens_mean"] is not None
+        assert p["tokens_estimated"] == (mode == "fake")
+        assert p["synthetic"] == (mode == "replay")
+        assert (p["latency_p50_s"] is None) == (mode == "fake")
+    drift = report["profiles"]["v1.9"]["drift_mean"]
+    assert set(drift) == set(engine.PROFILES["v1.9"]["score_map"])
+    assert all(v is not None for v in drift.values())
+    assert json.loads(out.read_text())["runs"]["v2.3.1"][0]["error"] is None
+
+def test_bench_reports_missing_responses(tmp_path):
+    corpus = tmp_path / "corpus.jsonl"
+    corpus.write_text(json.dumps({"id": "bare", "jd": "j", "cv": "c", "transcript": "t"}) + "\n")
+    report = bench.main([str(corpus)])
+    assert len(report["errors"]) == 2
+    assert "No recorded response for case 'bare'" in report["errors"][0]["error"]
+
+def test_bench_dedupes_profiles_and_rejects_bad_flags():
+    report = bench.main([SAMPLE_CORPUS, "--mode", "fake", "--profiles", "v1.9", "v1.9"])
+    assert report["profiles"]["v1.9"]["cases"] == 2
+    for argv in (["--record"], ["--mode", "fake", "--sleep"], ["--profiles", "nope"]):
+        with pytest.raises(SystemExit):
+            bench.main([SAMPLE_CORPUS] + argv)
+
+def test_report_legends_only_when_flagged(tmp_path, capsys):
+    corpus = tmp_path / "corpus.jsonl"
+    text = json.dumps({"candidate": {"scores": {"technical_depth": 7}, "verdict": "Hire"}})
+    rec = {"text": text, "input_tokens": 300, "output_tokens": 40, "latency_s": 2.0}
+    corpus.write_text(json.dumps({"id": "real", "jd": "j", "cv": "c", "transcript": "t",
+                                  "responses": {"v2.3.1": rec}}) + "\n")
+    bench.main([str(corpus), "--profiles", "v2.3.1"])
+    out = capsys.readouterr().out
+    assert "~ =" not in out and "* =" not in out
+    bench.main([SAMPLE_CORPUS])
+    out = capsys.readouterr().out
+    assert "* = synthetic" in out and "~ =" not in out